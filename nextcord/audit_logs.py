@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import contextlib
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,6 +15,7 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    final,
 )
 
 from . import enums, utils
@@ -76,6 +76,15 @@ if TYPE_CHECKING:
     ]
 
 
+_MISSING = object()
+
+# pre-bound so transformer calls pay one global load instead of a module
+# attribute lookup each time
+_try_enum = enums.try_enum
+_ChannelType = enums.ChannelType
+_StickerType = enums.StickerType
+
+
 def _transform_permissions(_entry: AuditLogEntry, data: str) -> Permissions:
     return Permissions(int(data))
 
@@ -93,7 +102,8 @@ def _transform_channel(
 ) -> Optional[Union[abc.GuildChannel, Object]]:
     if data is None:
         return None
-    return entry.guild.get_channel(int(data)) or Object(id=data)
+    channel_id = int(data)
+    return entry.guild.get_channel(channel_id) or Object(id=channel_id)
 
 
 def _transform_member_id(
@@ -113,26 +123,24 @@ def _transform_guild_id(entry: AuditLogEntry, data: Optional[Snowflake]) -> Opti
 def _transform_overwrites(
     entry: AuditLogEntry, data: List[PermissionOverwritePayload]
 ) -> List[Tuple[Object, PermissionOverwrite]]:
-    overwrites = []
-    for elem in data:
-        allow = Permissions(int(elem["allow"]))
-        deny = Permissions(int(elem["deny"]))
-        ow = PermissionOverwrite.from_pair(allow, deny)
+    get_role = entry.guild.get_role
+    get_member = entry._get_member
+    from_pair = PermissionOverwrite.from_pair
 
-        ow_type = elem["type"]
+    def _resolve(elem: PermissionOverwritePayload) -> Tuple[Object, PermissionOverwrite]:
         ow_id = int(elem["id"])
-        target = None
-        if str(ow_type) == "0":
-            target = entry.guild.get_role(ow_id)
-        elif str(ow_type) == "1":
-            target = entry._get_member(ow_id)
-
-        if target is None:
-            target = Object(id=ow_id)
+        ow_type = elem["type"]
+        if ow_type in (0, "0"):
+            target = get_role(ow_id)
+        elif ow_type in (1, "1"):
+            target = get_member(ow_id)
+        else:
+            target = None
 
-        overwrites.append((target, ow))
+        ow = from_pair(Permissions(int(elem["allow"])), Permissions(int(elem["deny"])))
+        return (target or Object(id=ow_id), ow)
 
-    return overwrites
+    return [_resolve(elem) for elem in data]
 
 
 def _transform_icon(entry: AuditLogEntry, data: Optional[str]) -> Optional[Asset]:
@@ -148,10 +156,12 @@ def _transform_avatar(entry: AuditLogEntry, data: Optional[str]) -> Optional[Ass
 
 
 def _guild_hash_transformer(path: str) -> Callable[[AuditLogEntry, Optional[str]], Optional[Asset]]:
-    def _transform(entry: AuditLogEntry, data: Optional[str]) -> Optional[Asset]:
+    # bind via default arguments so each call uses LOAD_FAST instead of a
+    # closure-cell dereference
+    def _transform(entry: AuditLogEntry, data: Optional[str], _path: str = path) -> Optional[Asset]:
         if data is None:
             return None
-        return Asset._from_guild_image(entry._state, entry.guild.id, data, path=path)
+        return Asset._from_guild_image(entry._state, entry.guild.id, data, path=_path)
 
     return _transform
 
@@ -161,25 +171,35 @@ E = TypeVar("E", bound=enums.Enum)
 
 
 def _enum_transformer(enum: Type[E]) -> Callable[[AuditLogEntry, int], E]:
-    def _transform(_entry: AuditLogEntry, data: int) -> E:
-        return enums.try_enum(enum, data)
+    def _transform(
+        _entry: AuditLogEntry,
+        data: int,
+        _enum: Type[E] = enum,
+        _fn: Callable[..., E] = _try_enum,
+    ) -> E:
+        return _fn(_enum, data)
 
     return _transform
 
 
+_STICKER_ACTIONS = frozenset(
+    action for action in enums.AuditLogAction if action.name.startswith("sticker_")
+)
+
+
 def _transform_type(entry: AuditLogEntry, data: int) -> Union[enums.ChannelType, enums.StickerType]:
-    if entry.action.name.startswith("sticker_"):
-        return enums.try_enum(enums.StickerType, data)
-    return enums.try_enum(enums.ChannelType, data)
+    if entry.action in _STICKER_ACTIONS:
+        return _try_enum(_StickerType, data)
+    return _try_enum(_ChannelType, data)
 
 
 def _list_transformer(
     func: Callable[[AuditLogEntry, Any], T]
 ) -> Callable[[AuditLogEntry, Any], List[T]]:
-    def _transform(entry: AuditLogEntry, data: Any) -> List[T]:
-        if not data:
-            return []
-        return [func(entry, value) for value in data if value is not None]
+    def _transform(
+        entry: AuditLogEntry, data: Any, _func: Callable[[AuditLogEntry, Any], T] = func
+    ) -> List[T]:
+        return [_func(entry, value) for value in data if value is not None] if data else []
 
     return _transform
 
@@ -205,10 +225,11 @@ def _transform_role(
 ) -> Optional[Union[Role, Object]]:
     if data is None:
         return None
-    role = entry.guild.get_role(int(data))
-    return role or Object(id=data)
+    role_id = int(data)
+    return entry.guild.get_role(role_id) or Object(id=role_id)
 
 
+@final
 class AuditLogDiff:
     def __len__(self) -> int:
         return len(self.__dict__)
@@ -274,117 +295,246 @@ class AuditLogChanges:
     }
     # fmt: on
 
+    # TRANSFORMERS with the attribute rename already applied, so the change
+    # loop resolves each key with one lookup and no renaming branch
+    _RESOLVED: ClassVar[Dict[str, Tuple[str, Optional[Transformer]]]] = {
+        k: (v[0] or k, v[1]) for k, v in TRANSFORMERS.items()
+    }
+
     def __init__(self, entry: AuditLogEntry, data: List[AuditLogChangePayload]) -> None:
-        self.before = AuditLogDiff()
-        self.after = AuditLogDiff()
+        self._entry = entry
+        self._data = data
+
+    @utils.cached_property
+    def before(self) -> AuditLogDiff:
+        return self._build("old_value", "$remove")
+
+    @utils.cached_property
+    def after(self) -> AuditLogDiff:
+        return self._build("new_value", "$add")
+
+    def _build(self, value_key: str, role_key: str) -> AuditLogDiff:
+        # built lazily so that callers who only look at one side (or neither)
+        # never pay for the other side's transformer invocations
+        entry = self._entry
+        transformers = self._RESOLVED
+        changes: Dict[str, Any] = {}
 
-        for elem in data:
+        for elem in self._data:
             attr = elem["key"]
 
-            # special cases for role add/remove
-            if attr == "$add":
-                self._handle_role(self.before, self.after, entry, elem["new_value"])  # type: ignore
-                continue
-            if attr == "$remove":
-                self._handle_role(self.after, self.before, entry, elem["new_value"])  # type: ignore
+            # special cases for role add/remove: the parsed list lands on the
+            # side named by role_key, the other side just defaults to empty
+            if attr in ("$add", "$remove"):
+                if attr == role_key:
+                    changes["roles"] = self._handle_role(entry, elem["new_value"])  # type: ignore
+                elif "roles" not in changes:
+                    changes["roles"] = []
                 continue
 
-            try:
-                key, transformer = self.TRANSFORMERS[attr]
-            except (ValueError, KeyError):
-                transformer = None
-            else:
-                if key:
-                    attr = key
+            attr, transformer = transformers.get(attr, (attr, None))
 
             transformer: Optional[Transformer]
 
-            try:
-                before = elem["old_value"]
-            except KeyError:
-                before = None
-            else:
-                if transformer:
-                    before = transformer(entry, before)
-
-            setattr(self.before, attr, before)
-
-            try:
-                after = elem["new_value"]
-            except KeyError:
-                after = None
-            else:
-                if transformer:
-                    after = transformer(entry, after)
+            value = elem.get(value_key, _MISSING)
+            if value is _MISSING:
+                value = None
+            elif transformer is not None:
+                value = transformer(entry, value)
 
-            setattr(self.after, attr, after)
+            changes[attr] = value
 
         # add an alias
-        if hasattr(self.after, "colour"):
-            self.after.color = self.after.colour
-            self.before.color = self.before.colour
-        if hasattr(self.after, "expire_behavior"):
-            self.after.expire_behaviour = self.after.expire_behavior
-            self.before.expire_behaviour = self.before.expire_behavior
+        if "colour" in changes:
+            changes["color"] = changes["colour"]
+        if "expire_behavior" in changes:
+            changes["expire_behaviour"] = changes["expire_behavior"]
+
+        diff = AuditLogDiff()
+        diff.__dict__.update(changes)
+        return diff
 
     def __repr__(self) -> str:
         return f"<AuditLogChanges before={self.before!r} after={self.after!r}>"
 
     def _handle_role(
-        self,
-        first: AuditLogDiff,
-        second: AuditLogDiff,
-        entry: AuditLogEntry,
-        elem: List[RolePayload],
-    ) -> None:
-        if not hasattr(first, "roles"):
-            first.roles = []
-
-        data = []
-        g: Guild = entry.guild
+        self, entry: AuditLogEntry, elem: List[RolePayload]
+    ) -> List[Union[Role, Object]]:
+        get_role = entry.guild.get_role
 
-        for e in elem:
+        def _resolve(e: RolePayload) -> Union[Role, Object]:
             role_id = int(e["id"])
-            role = g.get_role(role_id)
+            role = get_role(role_id)
 
             if role is None:
                 role = Object(id=role_id)
                 role.name = e["name"]  # type: ignore
 
-            data.append(role)
+            return role
+
+        return [_resolve(e) for e in elem]
+
 
-        second.roles = data
+class _AuditLogProxy:
+    __slots__ = ()
 
+    def __init__(self, **kwargs: Any) -> None:
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+
+@final
+class _AuditLogProxyGeneric(_AuditLogProxy):
+    # fallback for actions without a dedicated extras shape; channel is the
+    # only attribute the generic path ever fills in
+    __slots__ = ("channel",)
+
+    channel: abc.GuildChannel
+
+
+@final
+class _AuditLogProxyMemberPrune(_AuditLogProxy):
+    __slots__ = ("delete_member_days", "members_removed")
 
-class _AuditLogProxyMemberPrune:
     delete_member_days: int
     members_removed: int
 
 
-class _AuditLogProxyMemberMoveOrMessageDelete:
+@final
+class _AuditLogProxyMemberMoveOrMessageDelete(_AuditLogProxy):
+    __slots__ = ("channel", "count")
+
     channel: abc.GuildChannel
     count: int
 
 
-class _AuditLogProxyMemberDisconnect:
+@final
+class _AuditLogProxyMemberDisconnect(_AuditLogProxy):
+    __slots__ = ("count",)
+
     count: int
 
 
-class _AuditLogProxyPinAction:
+@final
+class _AuditLogProxyPinAction(_AuditLogProxy):
+    __slots__ = ("channel", "message_id")
+
     channel: abc.GuildChannel
     message_id: int
 
 
-class _AuditLogProxyStageInstanceAction:
+@final
+class _AuditLogProxyStageInstanceAction(_AuditLogProxy):
+    __slots__ = ("channel",)
+
     channel: abc.GuildChannel
 
 
-class _AuditLogProxyAutoModerationBlockMessage:
+@final
+class _AuditLogProxyAutoModerationBlockMessage(_AuditLogProxy):
+    __slots__ = ("channel", "rule_name", "rule_trigger_type")
+
     channel: abc.GuildChannel
     rule_name: str
     rule_trigger_type: enums.AutoModerationTriggerType
 
 
+def _extra_member_prune(entry: AuditLogEntry, extra: Any) -> Dict[str, Any]:
+    # member prune has two keys with useful information
+    entry.extra = _AuditLogProxyMemberPrune(**{k: int(v) for k, v in extra.items()})
+    return {}
+
+
+def _extra_count(_entry: AuditLogEntry, extra: Any) -> Dict[str, Any]:
+    return {"count": int(extra["count"])}
+
+
+def _extra_pin(_entry: AuditLogEntry, extra: Any) -> Dict[str, Any]:
+    # the pin actions have a dict with some information
+    return {"message_id": int(extra["message_id"])}
+
+
+def _extra_overwrite(entry: AuditLogEntry, extra: Any) -> Dict[str, Any]:
+    instance_id = int(extra["id"])
+    the_type = extra.get("type")
+    if the_type == "1":
+        entry.extra = entry._get_member(instance_id)
+    elif the_type == "0":
+        role = entry.guild.get_role(instance_id)
+        if role is None:
+            role = Object(id=instance_id)
+            role.name = extra.get("role_name")  # type: ignore
+        entry.extra = role  # type: ignore
+    return {}
+
+
+def _extra_stage_instance(entry: AuditLogEntry, extra: Any) -> Dict[str, Any]:
+    channel_id = int(extra["channel_id"])
+    return {"channel": entry.guild.get_channel(channel_id) or Object(id=channel_id)}
+
+
+def _extra_auto_moderation(_entry: AuditLogEntry, extra: Any) -> Dict[str, Any]:
+    return {
+        "rule_name": extra["auto_moderation_rule_name"],
+        "rule_trigger_type": enums.try_enum(
+            enums.AutoModerationTriggerType,
+            int(extra["auto_moderation_rule_trigger_type"]),
+        ),
+    }
+
+
+# action groups that share an extras shape
+_COUNT_ACTIONS = frozenset(
+    {
+        enums.AuditLogAction.member_move,
+        enums.AuditLogAction.message_delete,
+        enums.AuditLogAction.member_disconnect,
+    }
+)
+_AUTO_MODERATION_ACTIONS = frozenset(
+    {
+        enums.AuditLogAction.auto_moderation_block_message,
+        enums.AuditLogAction.auto_moderation_flag_to_channel,
+        enums.AuditLogAction.auto_moderation_user_communication_disabled,
+    }
+)
+
+
+def _build_extra_handlers() -> Tuple[
+    Dict[enums.AuditLogAction, Callable[["AuditLogEntry", Any], Dict[str, Any]]],
+    Dict[enums.AuditLogAction, Type[_AuditLogProxy]],
+]:
+    actions = enums.AuditLogAction
+    handlers: Dict[enums.AuditLogAction, Callable[[AuditLogEntry, Any], Dict[str, Any]]] = {
+        actions.member_prune: _extra_member_prune,
+    }
+    proxies: Dict[enums.AuditLogAction, Type[_AuditLogProxy]] = {
+        actions.member_disconnect: _AuditLogProxyMemberDisconnect,
+    }
+    for action in _COUNT_ACTIONS:
+        handlers[action] = _extra_count
+        proxies.setdefault(action, _AuditLogProxyMemberMoveOrMessageDelete)
+    for action in _AUTO_MODERATION_ACTIONS:
+        handlers[action] = _extra_auto_moderation
+        proxies[action] = _AuditLogProxyAutoModerationBlockMessage
+    for action in actions:
+        name = action.name
+        if name.endswith("pin"):
+            handlers[action] = _extra_pin
+            proxies[action] = _AuditLogProxyPinAction
+        elif name.startswith("overwrite_"):
+            handlers[action] = _extra_overwrite
+        elif name.startswith("stage_instance"):
+            handlers[action] = _extra_stage_instance
+            proxies[action] = _AuditLogProxyStageInstanceAction
+    return handlers, proxies
+
+
+# classified once at import so _from_data dispatches on the action with a
+# single hashed lookup instead of rescanning the action name per entry
+_EXTRA_HANDLERS, _EXTRA_PROXIES = _build_extra_handlers()
+
+
 class AuditLogEntry(Hashable):
     r"""Represents an Audit Log entry.
 
@@ -454,75 +604,59 @@ class AuditLogEntry(Hashable):
         self._users = users
         self._from_data(data)
 
+    @classmethod
+    def _from_batch(
+        cls,
+        payloads: List[AuditLogEntryPayload],
+        *,
+        auto_moderation_rules: Dict[int, AutoModerationRule],
+        users: Dict[int, User],
+        guild: Guild,
+    ) -> Generator[AuditLogEntry, None, None]:
+        # batch construction path for Guild.audit_logs: bind the per-page
+        # invariants once instead of per entry
+        state = guild._state
+        for data in payloads:
+            self = cls.__new__(cls)
+            self._state = state
+            self.guild = guild
+            self._auto_moderation_rules = auto_moderation_rules
+            self._users = users
+            self._from_data(data)
+            yield self
+
     def _from_data(self, data: AuditLogEntryPayload) -> None:
         self.action = enums.try_enum(enums.AuditLogAction, data["action_type"])
         self.id = int(data["id"])
 
         # this key is technically not usually present
         self.reason = data.get("reason")
-        self.extra = data.get("options", {})  # type: ignore
+        extra = data.get("options", {})
+        self.extra = extra  # type: ignore
         # I gave up trying to fix this
 
-        elems: Dict[str, Any] = {}
-        channel_id = int(self.extra["channel_id"]) if self.extra.get("channel_id", None) else None  # type: ignore
-
-        if isinstance(self.action, enums.AuditLogAction) and self.extra:
-            if self.action is enums.AuditLogAction.member_prune:
-                # member prune has two keys with useful information
-                self.extra = type(  # type: ignore
-                    "_AuditLogProxy", (), {k: int(v) for k, v in self.extra.items()}  # type: ignore
-                )()
-            elif (
-                self.action is enums.AuditLogAction.member_move
-                or self.action is enums.AuditLogAction.message_delete
-            ):
-                elems = {
-                    "count": int(self.extra["count"]),  # type: ignore
-                }
-            elif self.action is enums.AuditLogAction.member_disconnect:
-                # The member disconnect action has a dict with some information
-                elems = {
-                    "count": int(self.extra["count"]),  # type: ignore
-                }
-            elif self.action.name.endswith("pin"):
-                # the pin actions have a dict with some information
-                elems = {
-                    "message_id": int(self.extra["message_id"]),  # type: ignore
-                }
-            elif self.action.name.startswith("overwrite_"):
-                # the overwrite_ actions have a dict with some information
-                instance_id = int(self.extra["id"])  # type: ignore
-                the_type = self.extra.get("type")  # type: ignore
-                if the_type == "1":
-                    self.extra = self._get_member(instance_id)
-                elif the_type == "0":
-                    role = self.guild.get_role(instance_id)
-                    if role is None:
-                        role = Object(id=instance_id)
-                        role.name = self.extra.get("role_name")  # type: ignore
-                    self.extra = role  # type: ignore
-            elif self.action.name.startswith("stage_instance"):
-                channel_id = int(self.extra["channel_id"])  # type: ignore
-                elems = {"channel": self.guild.get_channel(channel_id) or Object(id=channel_id)}
-            elif (
-                self.action is enums.AuditLogAction.auto_moderation_block_message
-                or self.action is enums.AuditLogAction.auto_moderation_flag_to_channel
-                or self.action is enums.AuditLogAction.auto_moderation_user_communication_disabled
-            ):
-                elems = {
-                    "rule_name": self.extra["auto_moderation_rule_name"],  # type: ignore
-                    "rule_trigger_type": enums.try_enum(
-                        enums.AutoModerationTriggerType,
-                        int(self.extra["auto_moderation_rule_trigger_type"]),  # type: ignore
-                    ),
-                }
-
-        # this just gets automatically filled in if present, this way prevents crashes if channel_id is None
-        if channel_id and self.action:
-            elems["channel"] = self.guild.get_channel_or_thread(channel_id) or Object(id=channel_id)
-
-        if type(self.extra) is dict:  # type: ignore
-            self.extra = type("_AuditLogProxy", (), elems)()  # type: ignore
+        if not extra:
+            # most actions carry no options payload, so skip the dispatch
+            # and channel resolution entirely
+            self.extra = _AuditLogProxyGeneric()  # type: ignore
+        else:
+            elems: Dict[str, Any] = {}
+            channel_id = int(extra["channel_id"]) if extra.get("channel_id", None) else None
+
+            if isinstance(self.action, enums.AuditLogAction):
+                handler = _EXTRA_HANDLERS.get(self.action)
+                if handler is not None:
+                    elems = handler(self, extra)
+
+            # this just gets automatically filled in if present, this way prevents crashes if channel_id is None
+            if channel_id and self.action:
+                elems["channel"] = self.guild.get_channel_or_thread(channel_id) or Object(
+                    id=channel_id
+                )
+
+            if isinstance(self.extra, dict):  # type: ignore
+                proxy_cls = _EXTRA_PROXIES.get(self.action, _AuditLogProxyGeneric)
+                self.extra = proxy_cls(**elems)  # type: ignore
 
         # this key is not present when the above is present, typically.
         # It's a list of { new_value: a, old_value: b, key: c }
@@ -550,15 +684,13 @@ class AuditLogEntry(Hashable):
         """Any: The target that got changed.
         The exact type of this depends on the action being done.
         """
-        try:
-            converter = getattr(self, "_convert_target_" + str(self.action.target_type))
-        except AttributeError:
+        converter = self._TARGET_CONVERTERS.get(self.action.target_type)
+        if converter is None:
             if self._target_id is None:
                 return None
 
             return Object(id=self._target_id)
-        else:
-            return converter(self._target_id)
+        return converter(self, self._target_id)
 
     @utils.cached_property
     def category(self) -> Optional[enums.AuditLogActionCategory]:
@@ -608,8 +740,9 @@ class AuditLogEntry(Hashable):
         }
 
         obj = Invite(state=self._state, data=fake_payload, guild=self.guild, channel=changeset.channel)  # type: ignore
-        with contextlib.suppress(AttributeError):
-            obj.inviter = changeset.inviter
+        inviter = getattr(changeset, "inviter", _MISSING)
+        if inviter is not _MISSING:
+            obj.inviter = inviter
 
         return obj
 
@@ -632,3 +765,19 @@ class AuditLogEntry(Hashable):
         self, rule_id: int
     ) -> Union[AutoModerationRule, Object]:
         return self._auto_moderation_rules.get(rule_id) or Object(id=rule_id)
+
+    # maps AuditLogAction.target_type to its converter, replacing the old
+    # getattr("_convert_target_" + ...) string build and AttributeError probe
+    _TARGET_CONVERTERS: ClassVar[Dict[Optional[str], Callable[["AuditLogEntry", int], Any]]] = {
+        "guild": _convert_target_guild,
+        "channel": _convert_target_channel,
+        "user": _convert_target_user,
+        "role": _convert_target_role,
+        "invite": _convert_target_invite,
+        "emoji": _convert_target_emoji,
+        "message": _convert_target_message,
+        "stage_instance": _convert_target_stage_instance,
+        "sticker": _convert_target_sticker,
+        "thread": _convert_target_thread,
+        "auto_moderation_rule": _convert_target_auto_moderation_rule,
+    }
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
 from .asset import Asset, AssetMixin
 from .partial_emoji import PartialEmoji, _EmojiTag
 from .user import User
-from .utils import MISSING, SnowflakeList, snowflake_time
+from .utils import MISSING, SnowflakeList, cached_slot_property, snowflake_time
 
 __all__ = ("Emoji",)
 
@@ -91,6 +91,7 @@ class Emoji(_EmojiTag, AssetMixin):
         "user",
         "available",
         "application_id",
+        "_cs_as_reaction",
     )
 
     def __init__(
@@ -120,6 +121,12 @@ class Emoji(_EmojiTag, AssetMixin):
     def _to_partial(self) -> PartialEmoji:
         return PartialEmoji(name=self.name, animated=self.animated, id=self.id)
 
+    @cached_slot_property("_cs_as_reaction")
+    def _as_reaction(self) -> str:
+        # emoji objects are cached on the state, so repeat reactions with the
+        # same emoji reuse the formatted key
+        return f"{self.name}:{self.id}"
+
     def __iter__(self) -> Iterator[Tuple[str, Any]]:
         for attr in self.__slots__:
             if attr[0] != "_":
@@ -6,10 +6,12 @@ import asyncio
 import logging
 import sys
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     ClassVar,
     Coroutine,
     Dict,
@@ -108,6 +110,13 @@ _USER_AGENT = "DiscordBot (https://github.com/nextcord/nextcord/ {0}) Python/{1[
 )
 
 
+@lru_cache(maxsize=256)
+def _quote_reason(reason: str) -> str:
+    # moderation bots reuse the same handful of audit-log reasons; quote each
+    # distinct one once instead of per request
+    return _uriquote(reason, safe="/ ")
+
+
 def _get_logging_auth(auth: Optional[str]) -> str:
     if auth is None:
         return "None"
@@ -762,7 +771,7 @@ class HTTPClient:
             pass
         else:
             if reason:
-                headers["X-Audit-Log-Reason"] = _uriquote(reason, safe="/ ")
+                headers["X-Audit-Log-Reason"] = _quote_reason(reason)
 
         auth = headers.get("Authorization")
 
@@ -1097,6 +1106,18 @@ class HTTPClient:
                 raise Forbidden(resp, "cannot retrieve asset")
             raise HTTPException(resp, "failed to get asset")
 
+    async def stream_from_cdn(self, url: str, *, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        async with self.__session.get(url) as resp:
+            if resp.status == 200:
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    yield chunk
+                return
+            if resp.status == 404:
+                raise NotFound(resp, "asset not found")
+            if resp.status == 403:
+                raise Forbidden(resp, "cannot retrieve asset")
+            raise HTTPException(resp, "failed to get asset")
+
     # state management
 
     async def close(self) -> None:
@@ -1516,10 +1537,12 @@ class HTTPClient:
         self,
         channel_id: Snowflake,
         message_id: Snowflake,
+        fields: Dict[str, Any],
         auth: Optional[str] = MISSING,
         retry_request: bool = True,
-        **fields: Any,
     ) -> Response[message.Message]:
+        # fields is the prebuilt JSON payload; taking the dict itself avoids
+        # repacking it through **kwargs on every edit
         r = Route(
             "PATCH",
             "/channels/{channel_id}/messages/{message_id}",
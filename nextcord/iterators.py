@@ -325,13 +325,13 @@ async def audit_log_iterator(
         }
         users = {int(user["id"]): state.create_user(user) for user in data.get("users", [])}
 
-        for item in entries:
-            yield AuditLogEntry(
-                data=item,
-                auto_moderation_rules=auto_moderation_rules,
-                users=users,
-                guild=guild,
-            )
+        for entry in AuditLogEntry._from_batch(
+            entries,
+            auto_moderation_rules=auto_moderation_rules,
+            users=users,
+            guild=guild,
+        ):
+            yield entry
 
 
 async def guild_iterator(
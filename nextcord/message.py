@@ -8,7 +8,10 @@ import contextlib
 import datetime
 import io
 import re
+import sys
 from array import array
+from functools import lru_cache
+from operator import methodcaller
 from os import PathLike
 from typing import (
     TYPE_CHECKING,
@@ -16,7 +19,9 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterable,
     List,
+    Literal,
     Optional,
     Set,
     Tuple,
@@ -29,14 +34,14 @@ from .components import _component_factory
 from .embeds import Embed
 from .emoji import Emoji
 from .enums import ChannelType, IntegrationType, MessageReferenceType, MessageType, try_enum
-from .errors import HTTPException, InvalidArgument
+from .errors import InvalidArgument
 from .file import File
 from .flags import AttachmentFlags, MessageFlags
 from .guild import Guild
 from .member import Member
 from .mixins import Hashable
 from .object import Object
-from .partial_emoji import PartialEmoji
+from .partial_emoji import PartialEmoji, _EmojiTag
 from .reaction import Reaction
 from .sticker import StickerItem
 from .threads import Thread
@@ -75,6 +80,7 @@ if TYPE_CHECKING:
         Reaction as ReactionPayload,
         RoleSubscriptionData as RoleSubscriptionDataPayload,
     )
+    from .types.sticker import StickerItem as StickerItemPayload
     from .types.threads import Thread as ThreadPayload, ThreadArchiveDuration
     from .types.user import User as UserPayload
     from .ui.view import View
@@ -95,18 +101,116 @@ __all__ = (
 )
 
 
+# custom emoji in mention form: <:name:id> or <a:name:id>; the reaction
+# endpoint wants just the :name:id part
+_REACTION_RE = re.compile(r"<(a?:[^:]+:\d+)>\Z")
+
+# all mention forms clean_content rewrites: <#id>, <@&id>, <@id> and <@!id>
+_ALL_MENTION_RE = re.compile(r"<(#|@&|@!?)(\d{15,20})>")
+
+
+def _parse_all_raw_mentions(content: str) -> Tuple[List[int], List[int], List[int]]:
+    # one scan of the content binning user, channel and role mentions, instead
+    # of the three separate passes the utils.parse_raw_* helpers would make
+    users: List[int] = []
+    channels: List[int] = []
+    roles: List[int] = []
+    for match in _ALL_MENTION_RE.finditer(content):
+        prefix = match.group(1)
+        if prefix == "#":
+            channels.append(int(match.group(2)))
+        elif prefix == "@&":
+            roles.append(int(match.group(2)))
+        else:
+            users.append(int(match.group(2)))
+    return users, channels, roles
+
+
+# bit positions in Message._bits; packing the booleans into one int saves
+# two slots per cached message
+_TTS_BIT = 1 << 0
+_PINNED_BIT = 1 << 1
+_MENTION_EVERYONE_BIT = 1 << 2
+
+# dense value->member table so the ingest path skips the EnumMeta call in
+# try_enum for every known message type
+_MESSAGE_TYPE_TABLE: Tuple[Optional[MessageType], ...] = tuple(
+    MessageType._value2member_map_.get(value)  # type: ignore
+    for value in range(max(member.value for member in MessageType) + 1)
+)
+
+
+def _message_type(value: int) -> MessageType:
+    if 0 <= value < len(_MESSAGE_TYPE_TABLE):
+        message_type = _MESSAGE_TYPE_TABLE[value]
+        if message_type is not None:
+            return message_type
+    return try_enum(MessageType, value)
+
+
+# shared empty result for the ~99% of messages with no mentions; immutable,
+# so handing the same one to every message is safe
+_EMPTY_TUPLE: Tuple[Any, ...] = ()
+
+# resolved once so edit() can flip the bit directly instead of building a
+# throwaway MessageFlags just to read .value back out
+_SUPPRESS_EMBEDS_FLAG: int = MessageFlags.suppress_embeds.flag
+
+# serializes embeds/attachments through map() in C rather than a Python-level
+# comprehension frame per element
+_to_dict = methodcaller("to_dict")
+
+# suppress() is stateless and reentrant, so one shared instance serves every
+# cache-invalidating delattr without allocating a context manager per use
+_suppress_attribute_error = contextlib.suppress(AttributeError)
+
+
+def _reaction_key(emoji):
+    # custom emoji compare by ID regardless of whether they arrive as Emoji
+    # or PartialEmoji; unicode emoji are plain strings, except in raw events
+    # where they show up as unicode PartialEmojis
+    if isinstance(emoji, _EmojiTag):
+        return emoji.id if emoji.id is not None else emoji.name
+    return emoji
+
+
+@lru_cache(maxsize=512)
+def _convert_str_reaction(emoji: str) -> str:
+    # Reactions can be in :name:id format, but not <:name:id>.
+    # Unicode emoji pass through untouched. Paginators spam the same few
+    # strings, so the parse result is memoized.
+    match = _REACTION_RE.match(emoji)
+    return match.group(1) if match is not None else emoji
+
+
 def convert_emoji_reaction(emoji):
-    if isinstance(emoji, Reaction):
+    # exact type checks first: callers almost always pass the concrete types,
+    # so the hot path skips the full isinstance MRO walk
+    t = type(emoji)
+    if t is Reaction:
         emoji = emoji.emoji
+        t = type(emoji)
+
+    if t is Emoji:
+        return emoji._as_reaction
+    if t is PartialEmoji:
+        return emoji._as_reaction
+    if t is str:
+        return _convert_str_reaction(emoji)
+
+    return _convert_emoji_reaction_slow(emoji)
+
 
+def _convert_emoji_reaction_slow(emoji):
+    # subclass support for the exact-type fast path above
+    if isinstance(emoji, Reaction):
+        return convert_emoji_reaction(emoji.emoji)
     if isinstance(emoji, Emoji):
-        return f"{emoji.name}:{emoji.id}"
+        return emoji._as_reaction
     if isinstance(emoji, PartialEmoji):
-        return emoji._as_reaction()
+        return emoji._as_reaction
     if isinstance(emoji, str):
-        # Reactions can be in :name:id format, but not <:name:id>.
-        # No existing emojis have <> in them, so this should be okay.
-        return emoji.strip("<>")
+        return _convert_str_reaction(emoji)
 
     raise InvalidArgument(
         f"emoji argument must be str, Emoji, or Reaction not {emoji.__class__.__name__}."
@@ -185,26 +289,35 @@ class Attachment(Hashable):
         "_waveform",
         "_cs_waveform",
         "_flags",
+        "_cs_flags",
+        "_is_spoiler",
     )
 
     def __init__(self, *, data: AttachmentPayload, state: ConnectionState) -> None:
+        get = data.get
         self.id: int = int(data["id"])
         self.size: int = data["size"]
-        self.height: Optional[int] = data.get("height")
-        self.width: Optional[int] = data.get("width")
         self.filename: str = data["filename"]
-        self.url: str = data.get("url")
-        self.proxy_url: str = data.get("proxy_url")
+        self.height: Optional[int] = get("height")
+        self.width: Optional[int] = get("width")
+        self.url: str = get("url")
+        self.proxy_url: str = get("proxy_url")
         self._http = state.http
-        self.content_type: Optional[str] = data.get("content_type")
-        self.description: Optional[str] = data.get("description")
-        self.duration_secs: Optional[float] = data.get("duration_secs")
-        self._waveform: Optional[str] = data.get("waveform")
-        self._flags: int = data.get("flags", 0)
+        # content types come from a small fixed set (image/png, video/mp4, ...);
+        # interning makes later comparisons pointer checks and dedupes storage
+        content_type = get("content_type")
+        self.content_type: Optional[str] = (
+            sys.intern(content_type) if content_type is not None else None
+        )
+        self.description: Optional[str] = get("description")
+        self.duration_secs: Optional[float] = get("duration_secs")
+        self._waveform: Optional[str] = get("waveform")
+        self._flags: int = get("flags", 0)
+        self._is_spoiler: bool = self.filename.startswith("SPOILER_")
 
     def is_spoiler(self) -> bool:
         """:class:`bool`: Whether this attachment contains a spoiler."""
-        return self.filename.startswith("SPOILER_")
+        return self._is_spoiler
 
     def __repr__(self) -> str:
         return f"<Attachment id={self.id} filename={self.filename!r} url={self.url!r}>"
@@ -252,15 +365,21 @@ class Attachment(Hashable):
         :class:`int`
             The number of bytes written.
         """
-        data = await self.read(use_cached=use_cached)
+        # stream in chunks so large attachments never sit fully in memory
+        url = self.proxy_url if use_cached else self.url
         if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data)
+            written = 0
+            async for chunk in self._http.stream_from_cdn(url):
+                written += fp.write(chunk)
             if seek_begin:
                 fp.seek(0)
             return written
 
         with open(fp, "wb") as f:  # noqa: ASYNC230
-            return f.write(data)
+            written = 0
+            async for chunk in self._http.stream_from_cdn(url):
+                written += f.write(chunk)
+            return written
 
     async def read(self, *, use_cached: bool = False) -> bytes:
         """|coro|
@@ -381,18 +500,16 @@ class Attachment(Hashable):
             "url": self.url,
             "spoiler": self.is_spoiler(),
         }
-        if self.height:
-            result["height"] = self.height
-        if self.width:
-            result["width"] = self.width
-        if self.content_type:
-            result["content_type"] = self.content_type
-        if self.description:
-            result["description"] = self.description
-        if self.duration_secs:
-            result["duration_secs"] = self.duration_secs
-        if self._waveform:
-            result["waveform"] = self._waveform
+        for key, value in (
+            ("height", self.height),
+            ("width", self.width),
+            ("content_type", self.content_type),
+            ("description", self.description),
+            ("duration_secs", self.duration_secs),
+            ("waveform", self._waveform),
+        ):
+            if value:
+                result[key] = value
         return result
 
     @utils.cached_slot_property("_cs_waveform")
@@ -403,9 +520,12 @@ class Attachment(Hashable):
         .. versionadded:: 3.0
         """
         if self._waveform is not None:
-            return array("B", base64.b64decode(self._waveform))
+            decoded = array("B")
+            decoded.frombytes(base64.b64decode(self._waveform))
+            return decoded
         return None
 
+    @utils.cached_slot_property("_cs_flags")
     def flags(self) -> AttachmentFlags:
         """Optional[:class:`AttachmentFlags`]: The avaliable flags that the attachment has.
 
@@ -499,6 +619,7 @@ class MessageReference:
         "resolved",
         "_state",
         "type",
+        "_cs_jump_url",
     )
 
     def __init__(
@@ -523,7 +644,7 @@ class MessageReference:
         self = cls.__new__(cls)
         self.type = MessageReferenceType(data.get("type", 0))
         self.message_id = utils.get_as_snowflake(data, "message_id")
-        self.channel_id = int(data.pop("channel_id"))
+        self.channel_id = int(data["channel_id"])
         self.guild_id = utils.get_as_snowflake(data, "guild_id")
         self.fail_if_not_exists = data.get("fail_if_not_exists", True)
         self._state = state
@@ -565,7 +686,7 @@ class MessageReference:
             type=type,
             message_id=message.id,
             channel_id=message.channel.id,
-            guild_id=getattr(message.guild, "id", None),
+            guild_id=message.guild.id if message.guild is not None else None,
             fail_if_not_exists=fail_if_not_exists,
         )
         self._state = message._state
@@ -576,10 +697,12 @@ class MessageReference:
         """Optional[:class:`~nextcord.Message`]: The cached message, if found in the internal message cache."""
         return self._state and self._state._get_message(self.message_id)
 
-    @property
+    @utils.cached_slot_property("_cs_jump_url")
     def jump_url(self) -> str:
         """:class:`str`: Returns a URL that allows the client to jump to the referenced message.
 
+        The result is cached: the referenced IDs never change after construction.
+
         .. versionadded:: 1.7
         """
         guild_id = self.guild_id if self.guild_id is not None else "@me"
@@ -604,16 +727,17 @@ class MessageReference:
 
 def flatten_handlers(cls):
     prefix = len("_handle_")
-    handlers = [
-        (key[prefix:], value)
+    handlers = {
+        key[prefix:]: value
         for key, value in cls.__dict__.items()
         if key.startswith("_handle_") and key != "_handle_member"
-    ]
+    }
 
     # store _handle_member last
-    handlers.append(("member", cls._handle_member))
-    cls._HANDLERS = handlers
-    cls._CACHED_SLOTS = [attr for attr in cls.__slots__ if attr.startswith("_cs_")]
+    handlers["member"] = cls._handle_member
+    cls._HANDLERS = tuple(handlers.items())
+    cls._HANDLERS_MAP = handlers
+    cls._CACHED_SLOTS = tuple(attr for attr in cls.__slots__ if attr.startswith("_cs_"))
     return cls
 
 
@@ -649,33 +773,63 @@ class MessageSnapshot:
         A list of components that the message contains.
     """
 
+    __slots__ = (
+        "_message",
+        "_state",
+        "_cs_embeds",
+        "_cs_attachments",
+        "_cs_mentions",
+        "_cs_mention_roles",
+        "_cs_sticker_items",
+        "_cs_components",
+        "type",
+        "content",
+        "timestamp",
+        "edited_timestamp",
+        "flags",
+    )
+
     def __init__(self, *, data: MessageSnapshotPayload, state: ConnectionState) -> None:
-        self._message = data["message"]
+        # the raw payload is kept so the sub-object lists below can be parsed
+        # lazily; most consumers only ever read the scalar fields
+        message = data["message"]
+        self._message = message
         self._state = state
 
-        self.type: MessageType = MessageType(self._message["type"])
-        self.content: str = self._message["content"]
-        self.embeds: List[Embed] = [Embed.from_dict(d) for d in self._message.get("embeds", [])]
-        self.attachments: List[Attachment] = [
-            Attachment(data=a, state=self._state) for a in self._message.get("attachments", [])
-        ]
-        self.timestamp: datetime.datetime = utils.parse_time(self._message["timestamp"])
+        self.type: MessageType = MessageType(message["type"])
+        self.content: str = message["content"]
+        self.timestamp: datetime.datetime = utils.parse_time(message["timestamp"])
         self.edited_timestamp: datetime.datetime | None = utils.parse_time(
-            self._message.get("edited_timestamp")
+            message.get("edited_timestamp")
         )
-        self.flags: MessageFlags = MessageFlags._from_value(self._message.get("flags", 0))
-        self.mentions: List[User] = [
-            User(state=self._state, data=u) for u in self._message.get("mentions", [])
-        ]
-        self.mention_roles: List[Object] = [
-            Object(r) for r in self._message.get("mention_roles", [])
-        ]
-        self.sticker_items: List[StickerItem] = [
-            StickerItem(state=self._state, data=s) for s in self._message.get("sticker_items", [])
-        ]
-        self.components: List[Component] = [
-            _component_factory(c) for c in self._message.get("components", [])
-        ]
+        self.flags: MessageFlags = MessageFlags._from_value(message.get("flags", 0))
+
+    @utils.cached_slot_property("_cs_embeds")
+    def embeds(self) -> List[Embed]:
+        return list(map(Embed.from_dict, self._message.get("embeds", ())))
+
+    @utils.cached_slot_property("_cs_attachments")
+    def attachments(self) -> List[Attachment]:
+        state = self._state
+        return [Attachment(data=a, state=state) for a in self._message.get("attachments", ())]
+
+    @utils.cached_slot_property("_cs_mentions")
+    def mentions(self) -> List[User]:
+        state = self._state
+        return [User(state=state, data=u) for u in self._message.get("mentions", ())]
+
+    @utils.cached_slot_property("_cs_mention_roles")
+    def mention_roles(self) -> List[Object]:
+        return list(map(Object, self._message.get("mention_roles", ())))
+
+    @utils.cached_slot_property("_cs_sticker_items")
+    def sticker_items(self) -> List[StickerItem]:
+        state = self._state
+        return [StickerItem(state=state, data=s) for s in self._message.get("sticker_items", ())]
+
+    @utils.cached_slot_property("_cs_components")
+    def components(self) -> List[Component]:
+        return list(map(_component_factory, self._message.get("components", ())))
 
 
 class MessageInteraction(Hashable):
@@ -858,6 +1012,7 @@ class MessageInteractionMetadata(Hashable):
         guild: Optional[Guild],
         state: ConnectionState,
     ) -> None:
+        get = data.get
         self._state: ConnectionState = state
 
         self.data: MessageInteractionMetadataPayload = data
@@ -865,29 +1020,31 @@ class MessageInteractionMetadata(Hashable):
         self.type: int = data["type"]
 
         # No member data is provided, retrieve from cache if possible
-        self.user = None if guild is None else guild.get_member(int(data["user"]["id"]))
+        user = data["user"]
+        self.user = None if guild is None else guild.get_member(int(user["id"]))
         if self.user is None:
-            self.user = self._state.create_user(data=data["user"])
+            self.user = state.create_user(data=user)
 
+        # direct member-map lookup skips the enum __call__ machinery
+        integration_types = IntegrationType._value2member_map_
         self.authorizing_integration_owners: Dict[IntegrationType, int] = {
-            IntegrationType(int(integration_type)): int(details)
+            integration_types[int(integration_type)]: int(details)  # type: ignore
             for integration_type, details in data["authorizing_integration_owners"].items()
         }
 
-        self.name: Optional[str] = data.get("name")
+        self.name: Optional[str] = get("name")
+        original_response_message_id = get("original_response_message_id")
         self.original_response_message_id: Optional[int] = (
-            int(data["original_response_message_id"])
-            if "original_response_message_id" in data
-            else None
+            int(original_response_message_id) if original_response_message_id is not None else None
         )
+        interacted_message_id = get("interacted_message_id")
         self.interacted_message_id: Optional[int] = (
-            int(data["interacted_message_id"]) if "interacted_message_id" in data else None
+            int(interacted_message_id) if interacted_message_id is not None else None
         )
+        triggering = get("triggering_interaction_metadata")
         self.triggering_interaction_metadata: Optional[MessageInteractionMetadata] = (
-            MessageInteractionMetadata(
-                data=data["triggering_interaction_metadata"], guild=guild, state=state
-            )
-            if "triggering_interaction_metadata" in data
+            MessageInteractionMetadata(data=triggering, guild=guild, state=state)
+            if triggering is not None
             else None
         )
 
@@ -910,6 +1067,192 @@ class MessageInteractionMetadata(Hashable):
         return self._state._get_message(self.interacted_message_id)
 
 
+_NEW_MEMBER_FORMATS = (
+    "{0} joined the party.",
+    "{0} is here.",
+    "Welcome, {0}. We hope you brought pizza.",
+    "A wild {0} appeared.",
+    "{0} just landed.",
+    "{0} just slid into the server.",
+    "{0} just showed up!",
+    "Welcome {0}. Say hi!",
+    "{0} hopped into the server.",
+    "Everyone welcome {0}!",
+    "Glad you're here, {0}.",
+    "Good to see you, {0}.",
+    "Yay you made it, {0}!",
+)
+
+
+def _system_content_plain(message: Message) -> str:
+    return message.content
+
+
+def _system_content_recipient_add(message: Message) -> str:
+    if message.channel.type is ChannelType.group:
+        return f"{message.author.name} added {message.mentions[0].name} to the group."
+    return f"{message.author.name} added {message.mentions[0].name} to the thread."
+
+
+def _system_content_recipient_remove(message: Message) -> str:
+    if message.channel.type is ChannelType.group:
+        return f"{message.author.name} removed {message.mentions[0].name} from the group."
+    return f"{message.author.name} removed {message.mentions[0].name} from the thread."
+
+
+def _system_content_channel_name_change(message: Message) -> str:
+    return f"{message.author.name} changed the channel name: **{message.content}**"
+
+
+def _system_content_channel_icon_change(message: Message) -> str:
+    return f"{message.author.name} changed the channel icon."
+
+
+def _system_content_pins_add(message: Message) -> str:
+    return f"{message.author.name} pinned a message to this channel."
+
+
+def _system_content_new_member(message: Message) -> str:
+    created_at_ms = int(message.created_at.timestamp() * 1000)
+    return _NEW_MEMBER_FORMATS[created_at_ms % len(_NEW_MEMBER_FORMATS)].format(message.author.name)
+
+
+def _system_content_premium_guild_subscription(message: Message) -> str:
+    if not message.content:
+        return f"{message.author.name} just boosted the server!"
+    return f"{message.author.name} just boosted the server **{message.content}** times!"
+
+
+def _system_content_premium_guild_tier_1(message: Message) -> str:
+    if not message.content:
+        return f"{message.author.name} just boosted the server! {message.guild} has achieved **Level 1!**"
+    return f"{message.author.name} just boosted the server **{message.content}** times! {message.guild} has achieved **Level 1!**"
+
+
+def _system_content_premium_guild_tier_2(message: Message) -> str:
+    if not message.content:
+        return f"{message.author.name} just boosted the server! {message.guild} has achieved **Level 2!**"
+    return f"{message.author.name} just boosted the server **{message.content}** times! {message.guild} has achieved **Level 2!**"
+
+
+def _system_content_premium_guild_tier_3(message: Message) -> str:
+    if not message.content:
+        return f"{message.author.name} just boosted the server! {message.guild} has achieved **Level 3!**"
+    return f"{message.author.name} just boosted the server **{message.content}** times! {message.guild} has achieved **Level 3!**"
+
+
+def _system_content_channel_follow_add(message: Message) -> str:
+    return f"{message.author.name} has added {message.content} to this channel"
+
+
+def _system_content_guild_stream(message: Message) -> str:
+    # the author will be a Member
+    return f"{message.author.name} is live! Now streaming {message.author.activity.name}"  # type: ignore
+
+
+def _system_content_guild_discovery_disqualified(_message: Message) -> str:
+    return "This server has been removed from Server Discovery because it no longer passes all the requirements. Check Server Settings for more details."
+
+
+def _system_content_guild_discovery_requalified(_message: Message) -> str:
+    return "This server is eligible for Server Discovery again and has been automatically relisted!"
+
+
+def _system_content_guild_discovery_grace_period_initial_warning(_message: Message) -> str:
+    return "This server has failed Discovery activity requirements for 1 week. If this server fails for 4 weeks in a row, it will be automatically removed from Discovery."
+
+
+def _system_content_guild_discovery_grace_period_final_warning(_message: Message) -> str:
+    return "This server has failed Discovery activity requirements for 3 weeks in a row. If this server fails for 1 more week, it will be removed from Discovery."
+
+
+def _system_content_thread_created(message: Message) -> str:
+    return f"{message.author.name} started a thread: **{message.content}**. See all **threads**."
+
+
+def _system_content_thread_starter_message(message: Message) -> str:
+    if message.reference is None or message.reference.resolved is None:
+        return "Sorry, we couldn't load the first message in this thread"
+
+    # the resolved message for the reference will be a Message
+    return message.reference.resolved.content  # type: ignore
+
+
+def _system_content_guild_invite_reminder(_message: Message) -> str:
+    return "Wondering who to invite?\nStart by inviting anyone who can help you build the server!"
+
+
+def _system_content_role_subscription_purchase(message: Message) -> Optional[str]:
+    role_subscription = message.role_subscription
+    if role_subscription is None:
+        return None
+
+    tier_name = role_subscription.tier_name
+    total_months_subscribed = role_subscription.total_months_subscribed
+    months = f"{total_months_subscribed} month{'s' if total_months_subscribed != 1 else ''}"
+    if role_subscription.is_renewal:
+        return f"{message.author.name} renewed {tier_name} and has been a subscriber of {message.guild} for {months}!"
+
+    return f"{message.author.name} joined {tier_name} and has been a subscriber of {message.guild} for {months}!"
+
+
+def _system_content_stage_start(message: Message) -> str:
+    return f"{message.author.display_name} started {message.content}"
+
+
+def _system_content_stage_end(message: Message) -> str:
+    return f"{message.author.display_name} ended {message.content}"
+
+
+def _system_content_stage_speaker(message: Message) -> str:
+    return f"{message.author.display_name} is now a speaker."
+
+
+def _system_content_stage_topic(message: Message) -> str:
+    return f"{message.author.display_name} changed the Stage topic: {message.content}"
+
+
+# message types whose content the user wrote themselves
+_NON_SYSTEM_TYPES = frozenset(
+    {
+        MessageType.default,
+        MessageType.reply,
+        MessageType.chat_input_command,
+        MessageType.context_menu_command,
+        MessageType.thread_starter_message,
+    }
+)
+
+_SYSTEM_CONTENT_HANDLERS: Dict[MessageType, Callable[[Message], Optional[str]]] = {
+    MessageType.default: _system_content_plain,
+    MessageType.recipient_add: _system_content_recipient_add,
+    MessageType.recipient_remove: _system_content_recipient_remove,
+    MessageType.channel_name_change: _system_content_channel_name_change,
+    MessageType.channel_icon_change: _system_content_channel_icon_change,
+    MessageType.pins_add: _system_content_pins_add,
+    MessageType.new_member: _system_content_new_member,
+    MessageType.premium_guild_subscription: _system_content_premium_guild_subscription,
+    MessageType.premium_guild_tier_1: _system_content_premium_guild_tier_1,
+    MessageType.premium_guild_tier_2: _system_content_premium_guild_tier_2,
+    MessageType.premium_guild_tier_3: _system_content_premium_guild_tier_3,
+    MessageType.channel_follow_add: _system_content_channel_follow_add,
+    MessageType.guild_stream: _system_content_guild_stream,
+    MessageType.guild_discovery_disqualified: _system_content_guild_discovery_disqualified,
+    MessageType.guild_discovery_requalified: _system_content_guild_discovery_requalified,
+    MessageType.guild_discovery_grace_period_initial_warning: _system_content_guild_discovery_grace_period_initial_warning,
+    MessageType.guild_discovery_grace_period_final_warning: _system_content_guild_discovery_grace_period_final_warning,
+    MessageType.thread_created: _system_content_thread_created,
+    MessageType.reply: _system_content_plain,
+    MessageType.thread_starter_message: _system_content_thread_starter_message,
+    MessageType.guild_invite_reminder: _system_content_guild_invite_reminder,
+    MessageType.role_subscription_purchase: _system_content_role_subscription_purchase,
+    MessageType.stage_start: _system_content_stage_start,
+    MessageType.stage_end: _system_content_stage_end,
+    MessageType.stage_speaker: _system_content_stage_speaker,
+    MessageType.stage_topic: _system_content_stage_topic,
+}
+
+
 @flatten_handlers
 class Message(Hashable):
     r"""Represents a message from Discord.
@@ -1045,47 +1388,53 @@ class Message(Hashable):
         .. versionadded:: 3.2
     """
 
+    # hot fields first: slot storage follows declaration order, so the handful
+    # of attributes every on_message dispatch touches share the leading cache
+    # lines of the instance
     __slots__ = (
         "_state",
-        "_edited_timestamp",
-        "_cs_channel_mentions",
-        "_cs_raw_mentions",
-        "_cs_clean_content",
-        "_cs_raw_channel_mentions",
-        "_cs_raw_role_mentions",
-        "_cs_system_content",
-        "tts",
-        "content",
-        "channel",
-        "webhook_id",
-        "mention_everyone",
-        "embeds",
         "id",
-        "interaction",
-        "interaction_metadata",
-        "mentions",
+        "channel",
         "author",
-        "attachments",
-        "nonce",
-        "pinned",
-        "role_mentions",
+        "content",
+        "guild",
         "type",
         "flags",
+        "_bits",
+        "webhook_id",
+        "mentions",
+        "role_mentions",
+        "nonce",
         "reactions",
+        "_reactions_by_key",
         "reference",
         "application",
         "activity",
-        "stickers",
-        "components",
-        "_background_tasks",
-        "guild",
+        "interaction",
+        "interaction_metadata",
         "snapshots",
         "role_subscription",
+        "_edited_timestamp",
+        "_raw_embeds",
+        "_raw_attachments",
+        "_raw_sticker_items",
+        "_raw_components",
+        "_background_tasks",
+        "_cs_channel_mentions",
+        "_cs_all_raw_mentions",
+        "_cs_clean_content",
+        "_cs_jump_url",
+        "_cs_system_content",
+        "_cs_embeds",
+        "_cs_attachments",
+        "_cs_stickers",
+        "_cs_components",
     )
 
     if TYPE_CHECKING:
-        _HANDLERS: ClassVar[List[Tuple[str, Callable[..., None]]]]
-        _CACHED_SLOTS: ClassVar[List[str]]
+        _HANDLERS: ClassVar[Tuple[Tuple[str, Callable[..., None]], ...]]
+        _HANDLERS_MAP: ClassVar[Dict[str, Callable[..., None]]]
+        _CACHED_SLOTS: ClassVar[Tuple[str, ...]]
         guild: Optional[Guild]
         reference: Optional[MessageReference]
         mentions: List[Union[User, Member]]
@@ -1099,36 +1448,46 @@ class Message(Hashable):
         channel: MessageableChannel,
         data: MessagePayload,
     ) -> None:
+        # runs on every MESSAGE_CREATE; bind the payload getter once and keep
+        # hot names local to cut bytecode-level lookups
+        get = data.get
         self._state: ConnectionState = state
         self.id: int = int(data["id"])
-        self.webhook_id: Optional[int] = utils.get_as_snowflake(data, "webhook_id")
+        webhook_id = get("webhook_id")
+        self.webhook_id: Optional[int] = int(webhook_id) if webhook_id else None
         self.reactions: List[Reaction] = [
-            Reaction(message=self, data=d) for d in data.get("reactions", [])
-        ]
-        self.attachments: List[Attachment] = [
-            Attachment(data=a, state=self._state) for a in data["attachments"]
+            Reaction(message=self, data=d) for d in get("reactions", [])
         ]
-        self.embeds: List[Embed] = [Embed.from_dict(a) for a in data["embeds"]]
-        self.application: Optional[MessageApplicationPayload] = data.get("application")
-        self.activity: Optional[MessageActivityPayload] = data.get("activity")
+        self._reactions_by_key: Dict[Union[int, str], Reaction] = {
+            _reaction_key(r.emoji): r for r in self.reactions
+        }
+        # most messages never have their embeds/attachments/stickers/components
+        # inspected; keep the raw payloads and materialize on first access
+        self._raw_attachments: List[AttachmentPayload] = data["attachments"]
+        self._raw_embeds: List[EmbedPayload] = data["embeds"]
+        self.application: Optional[MessageApplicationPayload] = get("application")
+        self.activity: Optional[MessageActivityPayload] = get("activity")
         self.channel: MessageableChannel = channel
         self._edited_timestamp: Optional[datetime.datetime] = utils.parse_time(
             data["edited_timestamp"]
         )
-        self.type: MessageType = try_enum(MessageType, data["type"])
-        self.pinned: bool = data["pinned"]
-        self.flags: MessageFlags = MessageFlags._from_value(data.get("flags", 0))
-        self.mention_everyone: bool = data["mention_everyone"]
-        self.tts: bool = data["tts"]
+        self.type: MessageType = _message_type(data["type"])
+        self.flags: MessageFlags = MessageFlags._from_value(get("flags", 0))
+        bits = 0
+        if data["tts"]:
+            bits |= _TTS_BIT
+        if data["pinned"]:
+            bits |= _PINNED_BIT
+        if data["mention_everyone"]:
+            bits |= _MENTION_EVERYONE_BIT
+        self._bits: int = bits
         self.content: str = data["content"]
-        self.nonce: Optional[Union[int, str]] = data.get("nonce")
-        self.stickers: List[StickerItem] = [
-            StickerItem(data=d, state=state) for d in data.get("sticker_items", [])
-        ]
-        self.components: List[Component] = [
-            _component_factory(d) for d in data.get("components", [])
-        ]
-        self._background_tasks: Set[asyncio.Task[None]] = set()
+        self.nonce: Optional[Union[int, str]] = get("nonce")
+        self._raw_sticker_items: List[StickerItemPayload] = get("sticker_items", [])
+        self._raw_components: List[ComponentPayload] = get("components", [])
+        # lazily created by _add_background_task: almost no message ever has
+        # a task attached, so skip the empty set allocation
+        self._background_tasks: Optional[Set[asyncio.Task[None]]] = None
 
         try:
             # if the channel doesn't have a guild attribute, we handle that
@@ -1139,19 +1498,15 @@ class Message(Hashable):
             else:
                 self.guild = None
 
-        if (
-            (thread_data := data.get("thread"))
-            and not self.thread
-            and isinstance(self.guild, Guild)
-        ):
+        if (thread_data := get("thread")) and not self.thread and isinstance(self.guild, Guild):
             self.guild._store_thread(thread_data)
 
         self.snapshots: List[MessageSnapshot] = [
-            MessageSnapshot(state=self._state, data=s) for s in data.get("message_snapshots", [])
+            MessageSnapshot(state=state, data=s) for s in get("message_snapshots", [])
         ]
 
         self.reference = None
-        if ref := data.get("message_reference"):
+        if ref := get("message_reference"):
             self.reference = ref = MessageReference.with_state(state, ref)
 
             if "referenced_message" in data:
@@ -1206,25 +1561,36 @@ class Message(Hashable):
             else:
                 setattr(self, key, transform(value))
 
+    def _add_background_task(self, task: asyncio.Task[None]) -> None:
+        if self._background_tasks is None:
+            self._background_tasks = set()
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _add_reaction(self, data, emoji: Emoji | PartialEmoji | str, user_id) -> Reaction:
-        finder: Callable[[Reaction], bool] = lambda r: r.emoji == emoji
-        reaction = utils.find(finder, self.reactions)
-        is_me = data["me"] = user_id == self._state.self_id
+        key = _reaction_key(emoji)
+        reaction = self._reactions_by_key.get(key)
+        is_me = user_id == self._state.self_id
 
         if reaction is None:
+            # only the create path reads the payload, so only it needs the
+            # "me" field stamped in
+            data["me"] = is_me
             reaction = Reaction(message=self, data=data, emoji=emoji)
             self.reactions.append(reaction)
+            self._reactions_by_key[key] = reaction
         else:
             reaction.count += 1
             if is_me:
-                reaction.me = is_me
+                reaction.me = True
 
         return reaction
 
     def _remove_reaction(
         self, data: ReactionPayload, emoji: EmojiInputType, user_id: int
     ) -> Reaction:
-        reaction = utils.find(lambda r: r.emoji == emoji, self.reactions)
+        key = _reaction_key(emoji)
+        reaction = self._reactions_by_key.get(key)
 
         if reaction is None:
             # already removed?
@@ -1237,39 +1603,39 @@ class Message(Hashable):
         if user_id == self._state.self_id:
             reaction.me = False
         if reaction.count == 0:
+            del self._reactions_by_key[key]
             # this raises ValueError if something went wrong as well.
             self.reactions.remove(reaction)
 
         return reaction
 
     def _clear_emoji(self, emoji) -> Optional[Reaction]:
-        to_check = str(emoji)
-        for index, reaction in enumerate(self.reactions):  # noqa: B007
-            if str(reaction.emoji) == to_check:
-                break
-        else:
+        reaction = self._reactions_by_key.pop(_reaction_key(emoji), None)
+        if reaction is None:
             # didn't find anything so just return
             return None
 
-        del self.reactions[index]
+        self.reactions.remove(reaction)
         return reaction
 
     def _update(self, data) -> None:
         # In an update scheme, 'author' key has to be handled before 'member'
-        # otherwise they overwrite each other which is undesirable.
-        # Since there's no good way to do this we have to iterate over every
-        # handler rather than iterating over the keys which is a little slower
-        for key, handler in self._HANDLERS:
-            try:
-                value = data[key]
-            except KeyError:
-                continue
-            else:
-                handler(self, value)
-
-        # clear the cached properties
+        # otherwise they overwrite each other which is undesirable, so 'member'
+        # is deferred until the end. Every other handler only reads its own
+        # payload key, so the C-level key intersection finds exactly the
+        # fields this (usually partial) payload actually carries.
+        handlers = self._HANDLERS_MAP
+        for key in data.keys() & handlers.keys():
+            if key != "member":
+                handlers[key](self, data[key])
+
+        if "member" in data:
+            self._handle_member(data["member"])
+
+        # clear the cached properties; the shared suppress() instance avoids
+        # allocating a context manager per slot per update
         for attr in self._CACHED_SLOTS:
-            with contextlib.suppress(AttributeError):
+            with _suppress_attribute_error:
                 delattr(self, attr)
 
     def _handle_edited_timestamp(self, value: str) -> None:
@@ -1294,26 +1660,31 @@ class Message(Hashable):
         self.tts = value
 
     def _handle_type(self, value: int) -> None:
-        self.type = try_enum(MessageType, value)
+        self.type = _message_type(value)
 
     def _handle_content(self, value: str) -> None:
         self.content = value
 
     def _handle_attachments(self, value: List[AttachmentPayload]) -> None:
-        self.attachments = [Attachment(data=a, state=self._state) for a in value]
+        # _update clears _cs_attachments right after the handlers run
+        self._raw_attachments = value
 
     def _handle_embeds(self, value: List[EmbedPayload]) -> None:
-        self.embeds = [Embed.from_dict(data) for data in value]
+        self._raw_embeds = value
 
     def _handle_nonce(self, value: Union[str, int]) -> None:
         self.nonce = value
 
     def _handle_author(self, author: UserPayload) -> None:
+        # the member cache hit is the common case; resolving it first skips
+        # the user-cache lookup entirely
+        guild = self.guild
+        if isinstance(guild, Guild):
+            member = guild._members.get(int(author["id"]))
+            if member is not None:
+                self.author = member
+                return
         self.author = self._state.store_user(author)
-        if isinstance(self.guild, Guild):
-            found = self.guild.get_member(self.author.id)
-            if found is not None:
-                self.author = found
 
     def _handle_member(self, member: MemberPayload) -> None:
         # The gateway now gives us full Member objects sometimes with the following keys
@@ -1332,31 +1703,43 @@ class Message(Hashable):
             self.author = Member._from_message(message=self, data=member)
 
     def _handle_mentions(self, mentions: List[UserWithMemberPayload]) -> None:
-        self.mentions = r = []
+        if not mentions:
+            self.mentions = _EMPTY_TUPLE  # type: ignore
+            return
+
         guild = self.guild
         state = self._state
         if not isinstance(guild, Guild):
             self.mentions = [state.store_user(m) for m in mentions]
             return
 
-        for mention in filter(None, mentions):
-            id_search = int(mention["id"])
-            member = guild.get_member(id_search)
+        # wide mention lists are hot; bind the lookups once
+        members = guild._members
+        upgrade = Member._try_upgrade
+        self.mentions = r = []
+        append = r.append
+        for mention in mentions:
+            member = members.get(int(mention["id"]))
             if member is not None:
-                r.append(member)
+                append(member)
             else:
-                r.append(Member._try_upgrade(data=mention, guild=guild, state=state))
+                append(upgrade(data=mention, guild=guild, state=state))
 
     def _handle_mention_roles(self, role_mentions: List[int]) -> None:
-        self.role_mentions = []
-        if isinstance(self.guild, Guild):
-            for role_id in map(int, role_mentions):
-                role = self.guild.get_role(role_id)
-                if role is not None:
-                    self.role_mentions.append(role)
+        guild = self.guild
+        if not role_mentions or not isinstance(guild, Guild):
+            self.role_mentions = _EMPTY_TUPLE  # type: ignore
+            return
+
+        roles = guild._roles
+        self.role_mentions = [
+            role
+            for role in (roles.get(int(role_id)) for role_id in role_mentions)
+            if role is not None
+        ]
 
     def _handle_components(self, components: List[ComponentPayload]) -> None:
-        self.components = [_component_factory(d) for d in components]
+        self._raw_components = components
 
     def _handle_thread(self, thread: Optional[ThreadPayload]) -> None:
         if thread:
@@ -1367,8 +1750,32 @@ class Message(Hashable):
     ) -> None:
         self.guild = new_guild
         self.channel = new_channel
+        with _suppress_attribute_error:
+            del self._cs_jump_url
+
+    @utils.cached_slot_property("_cs_attachments")
+    def attachments(self) -> List[Attachment]:
+        state = self._state
+        return [Attachment(data=a, state=state) for a in self._raw_attachments]
+
+    @utils.cached_slot_property("_cs_embeds")
+    def embeds(self) -> List[Embed]:
+        return list(map(Embed.from_dict, self._raw_embeds))
+
+    @utils.cached_slot_property("_cs_stickers")
+    def stickers(self) -> List[StickerItem]:
+        state = self._state
+        return [StickerItem(data=d, state=state) for d in self._raw_sticker_items]
+
+    @utils.cached_slot_property("_cs_components")
+    def components(self) -> List[Component]:
+        return list(map(_component_factory, self._raw_components))
+
+    @utils.cached_slot_property("_cs_all_raw_mentions")
+    def _all_raw_mentions(self) -> Tuple[List[int], List[int], List[int]]:
+        return _parse_all_raw_mentions(self.content)
 
-    @utils.cached_slot_property("_cs_raw_mentions")
+    @property
     def raw_mentions(self) -> List[int]:
         """List[:class:`int`]: A property that returns an array of user IDs matched with
         the syntax of ``<@user_id>`` in the message content.
@@ -1376,21 +1783,21 @@ class Message(Hashable):
         This allows you to receive the user IDs of mentioned users
         even in a private message context.
         """
-        return utils.parse_raw_mentions(self.content)
+        return self._all_raw_mentions[0]
 
-    @utils.cached_slot_property("_cs_raw_channel_mentions")
+    @property
     def raw_channel_mentions(self) -> List[int]:
         """List[:class:`int`]: A property that returns an array of channel IDs matched with
         the syntax of ``<#channel_id>`` in the message content.
         """
-        return utils.parse_raw_channel_mentions(self.content)
+        return self._all_raw_mentions[1]
 
-    @utils.cached_slot_property("_cs_raw_role_mentions")
+    @property
     def raw_role_mentions(self) -> List[int]:
         """List[:class:`int`]: A property that returns an array of role IDs matched with
         the syntax of ``<@&role_id>`` in the message content.
         """
-        return utils.parse_raw_role_mentions(self.content)
+        return self._all_raw_mentions[2]
 
     @utils.cached_slot_property("_cs_channel_mentions")
     def channel_mentions(self) -> List[GuildChannel]:
@@ -1416,34 +1823,72 @@ class Message(Hashable):
             respectively, along with this function.
         """
 
-        transformations = {
-            re.escape(f"<#{channel.id}>"): "#" + channel.name for channel in self.channel_mentions
-        }
+        content = self.content
+        if "<" not in content:
+            # no mention can exist at all; the substring scan is C-level and
+            # skips the whole regex pass for most messages
+            return escape_mentions(content)
 
-        mention_transforms = {
-            re.escape(f"<@{member.id}>"): "@" + member.display_name for member in self.mentions
-        }
+        channel_names = (
+            {channel.id: channel.name for channel in self.channel_mentions}
+            if "<#" in content
+            else {}
+        )
+        member_names = (
+            {member.id: member.display_name for member in self.mentions} if "<@" in content else {}
+        )
+        role_names = (
+            {role.id: role.name for role in self.role_mentions}
+            if self.guild is not None and "<@&" in content
+            else {}
+        )
 
-        # add the <@!user_id> cases as well..
-        second_mention_transforms = {
-            re.escape(f"<@!{member.id}>"): "@" + member.display_name for member in self.mentions
-        }
+        # mentions of entities we do not know about are left untouched
+        def repl(match):
+            prefix = match.group(1)
+            if prefix == "#":
+                name = channel_names.get(int(match.group(2)))
+                return match.group(0) if name is None else f"#{name}"
+            if prefix == "@&":
+                name = role_names.get(int(match.group(2)))
+            else:
+                name = member_names.get(int(match.group(2)))
+            return match.group(0) if name is None else f"@{name}"
 
-        transformations.update(mention_transforms)
-        transformations.update(second_mention_transforms)
+        return escape_mentions(_ALL_MENTION_RE.sub(repl, content))
 
-        if self.guild is not None:
-            role_transforms = {
-                re.escape(f"<@&{role.id}>"): "@" + role.name for role in self.role_mentions
-            }
-            transformations.update(role_transforms)
+    @property
+    def tts(self) -> bool:
+        return bool(self._bits & _TTS_BIT)
 
-        def repl(obj):
-            return transformations.get(re.escape(obj.group(0)), "")
+    @tts.setter
+    def tts(self, value: bool) -> None:
+        if value:
+            self._bits |= _TTS_BIT
+        else:
+            self._bits &= ~_TTS_BIT
 
-        pattern = re.compile("|".join(transformations.keys()))
-        result = pattern.sub(repl, self.content)
-        return escape_mentions(result)
+    @property
+    def pinned(self) -> bool:
+        return bool(self._bits & _PINNED_BIT)
+
+    @pinned.setter
+    def pinned(self, value: bool) -> None:
+        if value:
+            self._bits |= _PINNED_BIT
+        else:
+            self._bits &= ~_PINNED_BIT
+
+    @property
+    def mention_everyone(self) -> bool:
+        return bool(self._bits & _MENTION_EVERYONE_BIT)
+
+    @mention_everyone.setter
+    def mention_everyone(self, value: bool) -> None:
+        if value:
+            self._bits |= _MENTION_EVERYONE_BIT
+        else:
+            self._bits &= ~_MENTION_EVERYONE_BIT
 
     @property
     def created_at(self) -> datetime.datetime:
@@ -1455,10 +1900,11 @@ class Message(Hashable):
         """Optional[:class:`datetime.datetime`]: An aware UTC datetime object containing the edited time of the message."""
         return self._edited_timestamp
 
-    @property
+    @utils.cached_slot_property("_cs_jump_url")
     def jump_url(self) -> str:
         """:class:`str`: Returns a URL that allows the client to jump to this message."""
-        guild_id = getattr(self.guild, "id", "@me")
+        guild = self.guild
+        guild_id = guild.id if guild is not None else "@me"
         return f"https://discord.com/channels/{guild_id}/{self.channel.id}/{self.id}"
 
     @property
@@ -1477,13 +1923,7 @@ class Message(Hashable):
 
         .. versionadded:: 1.3
         """
-        return self.type not in (
-            MessageType.default,
-            MessageType.reply,
-            MessageType.chat_input_command,
-            MessageType.context_menu_command,
-            MessageType.thread_starter_message,
-        )
+        return self.type not in _NON_SYSTEM_TYPES
 
     @utils.cached_slot_property("_cs_system_content")
     def system_content(self):
@@ -1495,128 +1935,8 @@ class Message(Hashable):
         returns an English message denoting the contents of the system message.
         """
 
-        if self.type is MessageType.default:
-            return self.content
-
-        if self.type is MessageType.recipient_add:
-            if self.channel.type is ChannelType.group:
-                return f"{self.author.name} added {self.mentions[0].name} to the group."
-            return f"{self.author.name} added {self.mentions[0].name} to the thread."
-
-        if self.type is MessageType.recipient_remove:
-            if self.channel.type is ChannelType.group:
-                return f"{self.author.name} removed {self.mentions[0].name} from the group."
-            return f"{self.author.name} removed {self.mentions[0].name} from the thread."
-
-        if self.type is MessageType.channel_name_change:
-            return f"{self.author.name} changed the channel name: **{self.content}**"
-
-        if self.type is MessageType.channel_icon_change:
-            return f"{self.author.name} changed the channel icon."
-
-        if self.type is MessageType.pins_add:
-            return f"{self.author.name} pinned a message to this channel."
-
-        if self.type is MessageType.new_member:
-            formats = [
-                "{0} joined the party.",
-                "{0} is here.",
-                "Welcome, {0}. We hope you brought pizza.",
-                "A wild {0} appeared.",
-                "{0} just landed.",
-                "{0} just slid into the server.",
-                "{0} just showed up!",
-                "Welcome {0}. Say hi!",
-                "{0} hopped into the server.",
-                "Everyone welcome {0}!",
-                "Glad you're here, {0}.",
-                "Good to see you, {0}.",
-                "Yay you made it, {0}!",
-            ]
-
-            created_at_ms = int(self.created_at.timestamp() * 1000)
-            return formats[created_at_ms % len(formats)].format(self.author.name)
-
-        if self.type is MessageType.premium_guild_subscription:
-            if not self.content:
-                return f"{self.author.name} just boosted the server!"
-            return f"{self.author.name} just boosted the server **{self.content}** times!"
-
-        if self.type is MessageType.premium_guild_tier_1:
-            if not self.content:
-                return f"{self.author.name} just boosted the server! {self.guild} has achieved **Level 1!**"
-            return f"{self.author.name} just boosted the server **{self.content}** times! {self.guild} has achieved **Level 1!**"
-
-        if self.type is MessageType.premium_guild_tier_2:
-            if not self.content:
-                return f"{self.author.name} just boosted the server! {self.guild} has achieved **Level 2!**"
-            return f"{self.author.name} just boosted the server **{self.content}** times! {self.guild} has achieved **Level 2!**"
-
-        if self.type is MessageType.premium_guild_tier_3:
-            if not self.content:
-                return f"{self.author.name} just boosted the server! {self.guild} has achieved **Level 3!**"
-            return f"{self.author.name} just boosted the server **{self.content}** times! {self.guild} has achieved **Level 3!**"
-
-        if self.type is MessageType.channel_follow_add:
-            return f"{self.author.name} has added {self.content} to this channel"
-
-        if self.type is MessageType.guild_stream:
-            # the author will be a Member
-            return f"{self.author.name} is live! Now streaming {self.author.activity.name}"  # type: ignore
-
-        if self.type is MessageType.guild_discovery_disqualified:
-            return "This server has been removed from Server Discovery because it no longer passes all the requirements. Check Server Settings for more details."
-
-        if self.type is MessageType.guild_discovery_requalified:
-            return "This server is eligible for Server Discovery again and has been automatically relisted!"
-
-        if self.type is MessageType.guild_discovery_grace_period_initial_warning:
-            return "This server has failed Discovery activity requirements for 1 week. If this server fails for 4 weeks in a row, it will be automatically removed from Discovery."
-
-        if self.type is MessageType.guild_discovery_grace_period_final_warning:
-            return "This server has failed Discovery activity requirements for 3 weeks in a row. If this server fails for 1 more week, it will be removed from Discovery."
-
-        if self.type is MessageType.thread_created:
-            return f"{self.author.name} started a thread: **{self.content}**. See all **threads**."
-
-        if self.type is MessageType.reply:
-            return self.content
-
-        if self.type is MessageType.thread_starter_message:
-            if self.reference is None or self.reference.resolved is None:
-                return "Sorry, we couldn't load the first message in this thread"
-
-            # the resolved message for the reference will be a Message
-            return self.reference.resolved.content  # type: ignore
-
-        if self.type is MessageType.guild_invite_reminder:
-            return "Wondering who to invite?\nStart by inviting anyone who can help you build the server!"
-
-        if (
-            self.type is MessageType.role_subscription_purchase
-            and self.role_subscription is not None
-        ):
-            tier_name = self.role_subscription.tier_name
-            total_months_subscribed = self.role_subscription.total_months_subscribed
-            months = f"{total_months_subscribed} month{'s' if total_months_subscribed != 1 else ''}"
-            if self.role_subscription.is_renewal:
-                return f"{self.author.name} renewed {tier_name} and has been a subscriber of {self.guild} for {months}!"
-
-            return f"{self.author.name} joined {tier_name} and has been a subscriber of {self.guild} for {months}!"
-
-        if self.type is MessageType.stage_start:
-            return f"{self.author.display_name} started {self.content}"
-
-        if self.type is MessageType.stage_end:
-            return f"{self.author.display_name} ended {self.content}"
-
-        if self.type is MessageType.stage_speaker:
-            return f"{self.author.display_name} is now a speaker."
-
-        if self.type is MessageType.stage_topic:
-            return f"{self.author.display_name} changed the Stage topic: {self.content}"
-
-        return None
+        handler = _SYSTEM_CONTENT_HANDLERS.get(self.type)
+        return handler(self) if handler is not None else None
 
     async def delete(self, *, delay: Optional[float] = None) -> None:
         """|coro|
@@ -1646,18 +1966,27 @@ class Message(Hashable):
             Deleting the message failed.
         """
         if delay is not None:
-
-            async def delete(delay: float) -> None:
-                await asyncio.sleep(delay)
-                with contextlib.suppress(HTTPException):
-                    await self._state.http.delete_message(self.channel.id, self.id)
-
-            task = asyncio.create_task(delete(delay))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+            self._state.schedule_message_delete(self.channel.id, self.id, delay)
         else:
             await self._state.http.delete_message(self.channel.id, self.id)
 
+    @overload
+    async def edit(
+        self,
+        *,
+        return_message: Literal[False],
+        content: Optional[str] = ...,
+        embed: Optional[Embed] = ...,
+        embeds: List[Embed] = ...,
+        attachments: List[Attachment] = ...,
+        suppress: bool = ...,
+        delete_after: Optional[float] = ...,
+        allowed_mentions: Optional[AllowedMentions] = ...,
+        view: Optional[View] = ...,
+        file: Optional[File] = ...,
+        files: Optional[List[File]] = ...,
+    ) -> None: ...
+
     @overload
     async def edit(
         self,
@@ -1726,7 +2055,8 @@ class Message(Hashable):
         view: Optional[View] = MISSING,
         file: Optional[File] = MISSING,
         files: Optional[List[File]] = MISSING,
-    ) -> Message:
+        return_message: bool = True,
+    ) -> Optional[Message]:
         """|coro|
 
         Edits the message.
@@ -1781,6 +2111,12 @@ class Message(Hashable):
             If provided, a list of new files to add to the message.
 
             .. versionadded:: 2.0
+        return_message: :class:`bool`
+            Whether to construct and return the edited :class:`Message` from
+            the API response. Set this to ``False`` when the return value is
+            discarded to skip parsing the response payload.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
@@ -1796,11 +2132,39 @@ class Message(Hashable):
 
         Returns
         -------
-        :class:`Message`
-            The edited message.
+        Optional[:class:`Message`]
+            The edited message, or ``None`` if ``return_message`` is ``False``.
         """
 
-        payload: Dict[str, Any] = {}
+        if (
+            content is not MISSING
+            and embed is MISSING
+            and embeds is MISSING
+            and attachments is MISSING
+            and suppress is MISSING
+            and allowed_mentions is MISSING
+            and view is MISSING
+            and file is MISSING
+            and files is MISSING
+        ):
+            # fast path for the most common edit shape, a bare content swap:
+            # skips the conflict checks and the rest of the payload assembly
+            state = self._state
+            payload: Dict[str, Any] = {"content": str(content) if content is not None else None}
+            if state.allowed_mentions is not None and self.author.id == state.self_id:
+                payload["allowed_mentions"] = state.allowed_mentions.to_dict()
+
+            data = await state.http.edit_message(self.channel.id, self.id, payload)
+            message = (
+                Message(state=state, channel=self.channel, data=data) if return_message else None
+            )
+
+            if delete_after is not None:
+                await self.delete(delay=delete_after)
+
+            return message
+
+        payload = {}
         if content is not MISSING:
             if content is not None:
                 payload["content"] = str(content)
@@ -1818,29 +2182,34 @@ class Message(Hashable):
             else:
                 payload["embeds"] = [embed.to_dict()]
         elif embeds is not MISSING:
-            payload["embeds"] = [e.to_dict() for e in embeds]
+            payload["embeds"] = list(map(_to_dict, embeds)) if embeds else []
 
         if suppress is not MISSING:
-            flags = MessageFlags._from_value(self.flags.value)
-            flags.suppress_embeds = suppress
-            payload["flags"] = flags.value
+            flags_value = self.flags.value
+            payload["flags"] = (
+                flags_value | _SUPPRESS_EMBEDS_FLAG
+                if suppress
+                else flags_value & ~_SUPPRESS_EMBEDS_FLAG
+            )
 
+        state = self._state
+        state_allowed_mentions = state.allowed_mentions
         if allowed_mentions is MISSING:
-            if self._state.allowed_mentions is not None and self.author.id == self._state.self_id:
-                payload["allowed_mentions"] = self._state.allowed_mentions.to_dict()
+            if state_allowed_mentions is not None and self.author.id == state.self_id:
+                payload["allowed_mentions"] = state_allowed_mentions.to_dict()
         elif allowed_mentions is not None:
-            if self._state.allowed_mentions is not None:
-                payload["allowed_mentions"] = self._state.allowed_mentions.merge(
+            if state_allowed_mentions is not None:
+                payload["allowed_mentions"] = state_allowed_mentions.merge(
                     allowed_mentions
                 ).to_dict()
             else:
                 payload["allowed_mentions"] = allowed_mentions.to_dict()
 
         if attachments is not MISSING:
-            payload["attachments"] = [a.to_dict() for a in attachments]
+            payload["attachments"] = list(map(_to_dict, attachments)) if attachments else []
 
         if view is not MISSING:
-            self._state.prevent_view_updates_for(self.id)
+            state.prevent_view_updates_for(self.id)
             if view:
                 payload["components"] = view.to_components()
             else:
@@ -1851,11 +2220,11 @@ class Message(Hashable):
         elif files is not MISSING:
             payload["files"] = files
 
-        data = await self._state.http.edit_message(self.channel.id, self.id, **payload)
-        message = Message(state=self._state, channel=self.channel, data=data)
+        data = await state.http.edit_message(self.channel.id, self.id, payload)
+        message = Message(state=state, channel=self.channel, data=data) if return_message else None
 
         if view and not view.is_finished() and view.prevent_update:
-            self._state.store_view(view, self.id)
+            state.store_view(view, self.id)
 
         if delete_after is not None:
             await self.delete(delay=delete_after)
@@ -1939,6 +2308,58 @@ class Message(Hashable):
         await self._state.http.unpin_message(self.channel.id, self.id, reason=reason)
         self.pinned = False
 
+    @staticmethod
+    async def bulk_suppress(
+        messages: Iterable[Message], *, suppress: bool = True, concurrency: int = 5
+    ) -> None:
+        """|coro|
+
+        Suppresses or unsuppresses embeds on several messages concurrently.
+
+        Discord has no bulk endpoint for this, so the edits are still
+        individual requests, but up to ``concurrency`` of them are kept in
+        flight at a time. The wall time is therefore bounded by the rate limit
+        and the concurrency window rather than by one round trip per message,
+        as a plain ``for`` loop of :meth:`edit` calls would be.
+
+        Using this requires :attr:`~.Permissions.manage_messages` for messages
+        that are not your own.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        messages: Iterable[:class:`Message`]
+            The messages to edit.
+        suppress: :class:`bool`
+            Whether to suppress embeds for the messages. If set to ``False``
+            this brings the embeds back if they were suppressed.
+        concurrency: :class:`int`
+            The maximum number of edit requests in flight at once.
+
+        Raises
+        ------
+        HTTPException
+            Editing a message failed.
+        Forbidden
+            You do not have permissions to suppress a message's embeds.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def edit_one(message: Message) -> None:
+            flags_value = message.flags.value
+            fields = {
+                "flags": (
+                    flags_value | _SUPPRESS_EMBEDS_FLAG
+                    if suppress
+                    else flags_value & ~_SUPPRESS_EMBEDS_FLAG
+                )
+            }
+            async with semaphore:
+                await message._state.http.edit_message(message.channel.id, message.id, fields)
+
+        await asyncio.gather(*map(edit_one, messages))
+
     async def add_reaction(self, emoji: EmojiInputType) -> None:
         """|coro|
 
@@ -1970,6 +2391,50 @@ class Message(Hashable):
         emoji = convert_emoji_reaction(emoji)
         await self._state.http.add_reaction(self.channel.id, self.id, emoji)
 
+    async def add_reactions(self, *emojis: EmojiInputType) -> None:
+        r"""|coro|
+
+        Adds multiple reactions to the message in one batch.
+
+        The requests are issued concurrently instead of one round trip per
+        ``await``, so the total wall time is bounded by the rate limit on the
+        reaction route rather than by the number of emojis. Rate limits are
+        still respected; concurrent requests on the same route queue on the
+        internal rate limit lock.
+
+        The emojis may be unicode emojis or custom guild :class:`Emoji`\s.
+
+        You must have the :attr:`~Permissions.read_message_history` permission
+        to use this. If nobody else has reacted to the message using one of
+        these emojis, the :attr:`~Permissions.add_reactions` permission is
+        required.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        emojis: Union[:class:`Emoji`, :class:`Reaction`, :class:`PartialEmoji`, :class:`str`]
+            The emojis to react with.
+
+        Raises
+        ------
+        HTTPException
+            Adding a reaction failed.
+        Forbidden
+            You do not have the proper permissions to react to the message.
+        NotFound
+            An emoji you specified was not found.
+        InvalidArgument
+            An emoji parameter is invalid.
+        """
+
+        converted = [convert_emoji_reaction(emoji) for emoji in emojis]
+        http = self._state.http
+        channel_id = self.channel.id
+        await asyncio.gather(
+            *(http.add_reaction(channel_id, self.id, emoji) for emoji in converted)
+        )
+
     async def remove_reaction(
         self, emoji: Union[EmojiInputType, Reaction], member: Snowflake
     ) -> None:
@@ -2181,15 +2646,33 @@ class Message(Hashable):
         return MessageReference.from_message(self, fail_if_not_exists=fail_if_not_exists)
 
     def to_message_reference_dict(self) -> MessageReferencePayload:
-        data: MessageReferencePayload = {
+        # built as single literals: this runs for every reply/forward, and on
+        # PartialMessage self.guild is a property call worth fetching once
+        guild = self.guild
+        if guild is not None:
+            return {
+                "message_id": self.id,
+                "channel_id": self.channel.id,
+                "guild_id": guild.id,
+            }
+        return {
             "message_id": self.id,
             "channel_id": self.channel.id,
         }
 
-        if self.guild is not None:
-            data["guild_id"] = self.guild.id
 
-        return data
+# channel types a PartialMessage can be constructed for; frozenset so the
+# per-construction membership test is one hash probe instead of a tuple scan
+_PARTIAL_MESSAGE_CHANNEL_TYPES = frozenset(
+    {
+        ChannelType.text,
+        ChannelType.news,
+        ChannelType.private,
+        ChannelType.news_thread,
+        ChannelType.public_thread,
+        ChannelType.private_thread,
+    }
+)
 
 
 class PartialMessage(Hashable):
@@ -2229,7 +2712,7 @@ class PartialMessage(Hashable):
         The message ID.
     """
 
-    __slots__ = ("channel", "id", "_cs_guild", "_state")
+    __slots__ = ("channel", "id", "_cs_guild", "_cs_jump_url", "_state")
 
     jump_url: str = Message.jump_url  # type: ignore
     delete = Message.delete
@@ -2237,6 +2720,7 @@ class PartialMessage(Hashable):
     pin = Message.pin
     unpin = Message.unpin
     add_reaction = Message.add_reaction
+    add_reactions = Message.add_reactions
     remove_reaction = Message.remove_reaction
     clear_reaction = Message.clear_reaction
     clear_reactions = Message.clear_reactions
@@ -2245,19 +2729,15 @@ class PartialMessage(Hashable):
     to_message_reference_dict = Message.to_message_reference_dict
 
     def __init__(self, *, channel: PartialMessageableChannel, id: int) -> None:
-        if channel.type not in (
-            ChannelType.text,
-            ChannelType.news,
-            ChannelType.private,
-            ChannelType.news_thread,
-            ChannelType.public_thread,
-            ChannelType.private_thread,
-        ):
+        if channel.type not in _PARTIAL_MESSAGE_CHANNEL_TYPES:
             raise TypeError(f"Expected TextChannel, DMChannel or Thread not {type(channel)!r}")
 
         self.channel: PartialMessageableChannel = channel
         self._state: ConnectionState = channel._state
         self.id: int = id
+        # the channel is fixed for the lifetime of a partial, so resolve the
+        # guild up front instead of through a cached descriptor per access
+        self._cs_guild: Optional[Guild] = getattr(channel, "guild", None)
 
     def _update(self, data) -> None:
         # This is used for duck typing purposes.
@@ -2276,10 +2756,10 @@ class PartialMessage(Hashable):
         """:class:`datetime.datetime`: The partial message's creation time in UTC."""
         return utils.snowflake_time(self.id)
 
-    @utils.cached_slot_property("_cs_guild")
+    @property
     def guild(self) -> Optional[Guild]:
         """Optional[:class:`Guild`]: The guild that the partial message belongs to, if applicable."""
-        return getattr(self.channel, "guild", None)
+        return self._cs_guild
 
     async def fetch(self) -> Message:
         """|coro|
@@ -2367,6 +2847,14 @@ class PartialMessage(Hashable):
             The message that was edited.
         """
 
+        if not fields or (len(fields) == 1 and "delete_after" in fields):
+            # common scheduling idiom — edit(delete_after=...) — carries no
+            # actual edit, so skip the whole field-normalization ladder
+            delete_after = fields.get("delete_after")
+            if delete_after is not None:
+                await self.delete(delay=delete_after)
+            return None
+
         try:
             content = fields["content"]
         except KeyError:
@@ -2383,16 +2871,15 @@ class PartialMessage(Hashable):
             fields["embeds"] = [embed.to_dict()] if embed is not None else []
 
         elif "embeds" in fields:
-            fields["embeds"] = [embed.to_dict() for embed in fields["embeds"]]
+            embeds = fields["embeds"]
+            fields["embeds"] = list(map(_to_dict, embeds)) if embeds else []
 
         try:
             suppress: bool = fields.pop("suppress")
         except KeyError:
             pass
         else:
-            flags = MessageFlags._from_value(0)
-            flags.suppress_embeds = suppress
-            fields["flags"] = flags.value
+            fields["flags"] = _SUPPRESS_EMBEDS_FLAG if suppress else 0
 
         delete_after = fields.pop("delete_after", None)
 
@@ -2423,7 +2910,7 @@ class PartialMessage(Hashable):
                 fields["components"] = []
 
         if fields:
-            data = await self._state.http.edit_message(self.channel.id, self.id, **fields)
+            data = await self._state.http.edit_message(self.channel.id, self.id, fields)
 
         if delete_after is not None:
             await self.delete(delay=delete_after)
@@ -68,7 +68,7 @@ class PartialEmoji(_EmojiTag, AssetMixin):
         The ID of the custom emoji, if applicable.
     """
 
-    __slots__ = ("animated", "name", "id", "_state")
+    __slots__ = ("animated", "name", "id", "_state", "_cs_as_reaction")
 
     _CUSTOM_EMOJI_RE = re.compile(
         r"<?(?P<animated>a)?:?(?P<name>[A-Za-z0-9\_]+):(?P<id>[0-9]{13,20})>?"
@@ -191,7 +191,10 @@ class PartialEmoji(_EmojiTag, AssetMixin):
         """:class:`bool`: Checks if this is a Unicode emoji."""
         return self.id is None
 
+    @utils.cached_slot_property("_cs_as_reaction")
     def _as_reaction(self) -> str:
+        # paginator-style code reacts with the same emoji object over and
+        # over; format the endpoint key once per instance
         if self.id is None:
             return self.name
         return f"{self.name}:{self.id}"
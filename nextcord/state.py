@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import copy
+import heapq
 import inspect
 import itertools
 import logging
@@ -35,7 +36,7 @@ from .channel import *
 from .channel import _channel_factory
 from .emoji import Emoji
 from .enums import ApplicationCommandType, ChannelType, Status, try_enum
-from .errors import Forbidden
+from .errors import Forbidden, HTTPException
 from .flags import ApplicationFlags, Intents, MemberCacheFlags
 from .guild import Guild
 from .integrations import _integration_factory
@@ -190,6 +191,11 @@ class ConnectionState:
         self._chunk_requests: Dict[Union[int, str], ChunkRequest] = {}
         self._chunk_tasks: Dict[Union[int, str], asyncio.Task[None]] = {}
         self._background_tasks: Set[asyncio.Task] = set()
+        # (deadline, channel_id, message_id) heap drained by a single worker
+        # task; delayed deletes share it instead of spawning a task each
+        self._delayed_deletes: List[Tuple[float, int, int]] = []
+        self._delayed_delete_event: asyncio.Event = asyncio.Event()
+        self._delayed_delete_task: Optional[asyncio.Task[None]] = None
 
         if activity is not None:
             if not isinstance(activity, BaseActivity):
@@ -292,6 +298,28 @@ class ConnectionState:
         else:
             self._messages: Optional[Deque[Message]] = None
 
+    def schedule_message_delete(self, channel_id: int, message_id: int, delay: float) -> None:
+        heapq.heappush(self._delayed_deletes, (self.loop.time() + delay, channel_id, message_id))
+        self._delayed_delete_event.set()
+        if self._delayed_delete_task is None or self._delayed_delete_task.done():
+            self._delayed_delete_task = self.loop.create_task(self._delayed_delete_worker())
+
+    async def _delayed_delete_worker(self) -> None:
+        heap = self._delayed_deletes
+        event = self._delayed_delete_event
+        while heap:
+            timeout = heap[0][0] - self.loop.time()
+            if timeout > 0:
+                # sleep until the earliest deadline, waking early if a
+                # shorter delay gets scheduled in the meantime
+                event.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), timeout)
+                continue
+            _, channel_id, message_id = heapq.heappop(heap)
+            with contextlib.suppress(HTTPException):
+                await self.http.delete_message(channel_id, message_id)
+
     def process_chunk_requests(
         self, guild_id: int, nonce: Optional[str], members: List[Member], complete: bool
     ) -> None:
@@ -1376,6 +1404,7 @@ class ConnectionState:
         if message is not None:
             old_reactions = message.reactions.copy()
             message.reactions.clear()
+            message._reactions_by_key.clear()
             self.dispatch("reaction_clear", message, old_reactions)
 
     def parse_message_reaction_remove(self, data) -> None:
@@ -215,21 +215,12 @@ class View:
         def key(item: Item) -> int:
             return item._rendered_row or 0
 
-        children = sorted(self.children, key=key)
-        components: List[ActionRowPayload] = []
-        for _, group in groupby(children, key=key):
-            children = [item.to_component_dict() for item in group]
-            if not children:
-                continue
-
-            components.append(
-                {
-                    "type": 1,
-                    "components": children,
-                }
-            )
-
-        return components
+        # groupby never yields empty groups, so each action row is non-empty
+        # by construction
+        return [
+            {"type": 1, "components": [item.to_component_dict() for item in group]}
+            for _, group in groupby(sorted(self.children, key=key), key=key)
+        ]
 
     @classmethod
     def from_message(cls, message: Message, /, *, timeout: Optional[float] = 180.0) -> View:
@@ -851,9 +851,7 @@ class WebhookMessage(Message):
                 with contextlib.suppress(HTTPException):
                     await self._state._webhook.delete_message(self.id)
 
-            task = asyncio.create_task(inner_call())
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+            self._add_background_task(asyncio.create_task(inner_call()))
         else:
             await self._state._webhook.delete_message(self.id)
 